@@ -106,12 +106,33 @@ class TextLine:
     ANTI_ALIASED = "L"
     FONT_MODE: str = ANTI_ALIASED
 
+    # KERNING WIDTH CACHE (bounded; keyed by value so mutated lines still hit)
+    KERNING_CACHE_MAX: int = 1024
+    KERNING_WIDTHS: dict[tuple, tuple[int, int]] = {}
+
     # STATIC HELPERS
     @staticmethod
+    @lru_cache(maxsize=None)
+    def loadFont(fontFile: str, fontPoint: int) -> ImageFont.FreeTypeFont:
+        """Load a font. Result is cached.\n
+        TextLines sharing a style share one font instance, which also
+        keys the font-based caches (`getsize`, `getTabWidth`) consistently.
+
+        Args:
+            fontFile (str): Font file path.
+            fontPoint (int): Font size.
+
+        Returns:
+            ImageFont.FreeTypeFont: Font instance.
+        """
+        return ImageFont.truetype(fontFile, fontPoint)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
     def getsize(
         text: str, font: ImageFont.FreeTypeFont
     ) -> tuple[tuple[int, int], tuple[int, int]]:
-        """Get size and offset for text, in px.
+        """Get size and offset for text, in px. Result is cached.
 
         Args:
             text (str): Text.
@@ -267,7 +288,7 @@ class TextLine:
 
     @staticmethod
     def getKerningWidth(textLine: TextLine) -> tuple[int, int]:
-        """Get Kerning width.
+        """Get Kerning width. Result is cached.
 
         Args:
             textLine (TextLine): TextLine.
@@ -275,6 +296,11 @@ class TextLine:
         Returns:
             tuple[int, int]: (`KERNING_LEFT`, `KERNING_RIGHT`), in px.
         """
+        cacheKey = (textLine.getText(), textLine.styleKey())
+        cached = TextLine.KERNING_WIDTHS.get(cacheKey)
+        if cached is not None:
+            return cached
+
         bbox = TextLine.getBbox(textLine)
 
         if TextLine.FIND_HIDDEN_KERNING:
@@ -287,7 +313,11 @@ class TextLine:
         kerningLeft = bbox[TextLine.X1]
         kerningRight = textLine.getSize()[TextLine.WIDTH] - bbox[TextLine.X2]
 
-        return (kerningLeft + LHK), (kerningRight + RHK)
+        kerningWidth = (kerningLeft + LHK), (kerningRight + RHK)
+        if len(TextLine.KERNING_WIDTHS) >= TextLine.KERNING_CACHE_MAX:
+            del TextLine.KERNING_WIDTHS[next(iter(TextLine.KERNING_WIDTHS))]
+        TextLine.KERNING_WIDTHS[cacheKey] = kerningWidth
+        return kerningWidth
 
     @staticmethod
     @lru_cache(maxsize=None)
@@ -797,6 +827,9 @@ class TextLine:
         return " ".join(
             [
                 "ffmpeg",
+                "-loglevel error",  # Skip banner/progress formatting cost.
+                "-threads 1",  # One frame per process; parallelism comes from the render pool.
+                "-filter_threads 1",
                 "-i",
                 '"{}"'.format(imgPath),
                 "-vf",
@@ -850,6 +883,7 @@ class TextLine:
                 RGBA = "RGBA"
                 IMG_EXT = ".png"
                 FORMAT = "PNG"
+                COMPRESS_LEVEL = 1  # zlib 0-9; the default 6 is encode-bound.
 
                 img = linesToDraw[0].getImg().convert(RGBA)
 
@@ -887,7 +921,11 @@ class TextLine:
 
                 # save result
                 os.makedirs(outputDir, exist_ok=True)
-                img.save(os.path.join(outputDir, imgName + IMG_EXT), FORMAT)
+                img.save(
+                    os.path.join(outputDir, imgName + IMG_EXT),
+                    FORMAT,
+                    compress_level=COMPRESS_LEVEL,
+                )
 
             case _:  # default
                 raise NotImplementedError("Render engine does not exist.")
@@ -921,7 +959,7 @@ class TextLine:
         self.img = img
 
         # dependent
-        self.font = ImageFont.truetype(fontFile, fontPoint)
+        self.font = TextLine.loadFont(fontFile, fontPoint)
         self.size = cast(tuple[int, int], None)
         self.trueHeight = cast(int, None)
         self.offset = cast(tuple[int, int], None)
@@ -976,6 +1014,16 @@ class TextLine:
             and self.color == other.color
         )
 
+    def styleKey(self) -> tuple[str, int, str]:
+        """Get TextLine style key.\n
+        A hashable style fingerprint; two TextLines share a style key
+        exactly when `compareStyle()` considers them equal.
+
+        Returns:
+            tuple[str, int, str]: (font file, font point, color).
+        """
+        return (self.fontFile, self.fontPoint, self.color)
+
     # HASH
     def __hash__(self) -> int:
         """Hash TextLine.
@@ -1205,6 +1253,23 @@ class TextLine:
 
         return self
 
+    def translate(self, dx: float, dy: float) -> TextLine:
+        """Shift TextLine position, relative to its current position.
+
+        See also:
+            `setPos()`
+
+        Args:
+            dx (float): `X` shift, in px.
+            dy (float): `Y` shift, in px.
+
+        Returns:
+            TextLine: Self.
+        """
+        self.position = (self.position[self.X] + dx, self.position[self.Y] + dy)
+
+        return self
+
     def setSize(self) -> TextLine:
         """Set TextLine size (`WIDTH`, `HEIGHT`) and offset (`OFFSET_X`, `OFFSET_Y`), in px.\n
         When a TextLine attribute is modified, `setSize()` must be rerun.
@@ -1285,7 +1350,7 @@ class TextLine:
             TextLine: Self.
         """
         self.fontPoint = fontPoint
-        self.font = ImageFont.truetype(self.fontFile, fontPoint)
+        self.font = TextLine.loadFont(self.fontFile, fontPoint)
         self.setSize()
 
         return self